@@ -1,21 +1,28 @@
+import os, sys
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from config import Config
-from flask_migrate import Migrate
+from flask_migrate import Migrate, upgrade
 
 db = SQLAlchemy()
 migrate = Migrate()
 
+# Alembic scripts live next to the app package (or in the PyInstaller bundle).
+basedir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MIGRATIONS_DIR = os.path.join(basedir, 'migrations')
+
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
     
     db.init_app(app)
-    migrate.init_app(app, db)
+    migrate.init_app(app, db, directory=MIGRATIONS_DIR)
     
     with app.app_context():
         # Import models so that the table definitions are registered with SQLAlchemy
         from app import models  
+        # Bring existing databases up to the current schema
+        upgrade()
         # Create all tables if they don't exist
         db.create_all()
     
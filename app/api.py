@@ -1,6 +1,13 @@
 import json, csv, io, os, tempfile, random
-from flask import Blueprint, request, jsonify, send_file, make_response
-from app.models import db, EventData
+from flask import Blueprint, request, send_file, make_response
+from app.models import (
+    db, EventData, Event, Venue, PaymentMethod,
+    event_lookup, venue_lookup, payment_method_lookup
+)
+from app.utils import (
+    COLUMNAR_MIMETYPE, wants_columnar, encode_columnar, parse_products,
+    json_response, compress_response
+)
 from datetime import datetime, timedelta
 
 # For PDF generation with Platypus
@@ -15,6 +22,18 @@ from openpyxl.utils import get_column_letter
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+# Compress JSON responses from the API (brotli if available, else gzip).
+api_bp.after_request(compress_response)
+
+# Column order of the columnar /get-events payload.
+EVENT_COLUMNS = [
+    "id", "event_name", "event_date_from", "event_date_to", "venue_name",
+    "operating_hours", "products_sold", "sales_volume", "price_per_unit",
+    "total_revenue", "sale_hour", "payment_method"
+]
+# Low-cardinality string columns sent as {"dict": [...], "codes": [...]}.
+EVENT_DICT_COLUMNS = {"event_name", "venue_name", "operating_hours", "payment_method"}
+
 def random_date(start, end):
     """Return a random datetime between start and end."""
     delta = end - start
@@ -22,6 +41,24 @@ def random_date(start, end):
     random_days = random.randrange(int_delta + 1)
     return start + timedelta(days=random_days)
 
+def resolve_dimension_ids(event_name, venue_name, payment_method):
+    """
+    Return (event_id, venue_id, payment_method_id) for the given names.
+    Event and venue names are validated first, so a rejected row never
+    leaves a new dimension row behind. A missing payment method defaults
+    to 'Cash', as in the migration.
+    """
+    for label, name in (("Event", event_name), ("Venue", venue_name)):
+        if name is None or name == "":
+            raise ValueError(f"{label} name is required")
+    if payment_method is None or payment_method == "":
+        payment_method = "Cash"
+    return (
+        event_lookup.id_for(event_name),
+        venue_lookup.id_for(venue_name),
+        payment_method_lookup.id_for(payment_method)
+    )
+
 @api_bp.route('/save-event', methods=['POST'])
 def save_event():
     data = request.get_json()
@@ -72,9 +109,13 @@ def save_event():
         # Products Sold: expect a list.
         products_sold_json = json.dumps(data.get('selectedProducts', []))
 
+        event_id, venue_id, payment_method_id = resolve_dimension_ids(
+            data.get('eventName'), data.get('venueName'), payment_method
+        )
+
         new_event = EventData(
-            event_name=data['eventName'],
-            venue_name=data['venueName'],
+            event_id=event_id,
+            venue_id=venue_id,
             operating_hours=data['operatingHours'],
             event_date_from=event_date_from,
             event_date_to=event_date_to,
@@ -83,19 +124,58 @@ def save_event():
             price_per_unit=price_per_unit,
             total_revenue=total_revenue,
             sale_hour=sale_hour,
-            payment_method=payment_method
+            payment_method_id=payment_method_id
         )
         db.session.add(new_event)
         db.session.commit()
-        return jsonify({"message": "Event saved successfully!"}), 201
+        return json_response({"message": "Event saved successfully!"}), 201
 
     except Exception as e:
-        return jsonify({"message": f"Error saving event: {str(e)}"}), 400
+        db.session.rollback()
+        return json_response({"message": f"Error saving event: {str(e)}"}), 400
 
 @api_bp.route('/get-events', methods=['GET'])
 def get_events():
+    """
+    Returns all events.
+    By default a list of row objects is returned. Clients that send
+    ?format=columnar or Accept: application/vnd.sales.columnar+json get
+    column arrays instead, with repeated strings dictionary-encoded and
+    products_sold as native arrays.
+    """
     try:
-        events = EventData.query.all()
+        events = db.session.query(
+            EventData.id, Event.name.label('event_name'), EventData.event_date_from,
+            EventData.event_date_to, Venue.name.label('venue_name'), EventData.operating_hours,
+            EventData.products_sold, EventData.sales_volume, EventData.price_per_unit,
+            EventData.total_revenue, EventData.sale_hour,
+            PaymentMethod.name.label('payment_method')
+        ).join(Event, EventData.event_id == Event.id
+        ).join(Venue, EventData.venue_id == Venue.id
+        ).join(PaymentMethod, EventData.payment_method_id == PaymentMethod.id
+        ).order_by(EventData.id).all()
+
+        if wants_columnar():
+            date_cache = {}
+
+            def fmt_date(d):
+                if not d:
+                    return ""
+                s = date_cache.get(d)
+                if s is None:
+                    s = date_cache[d] = d.strftime('%Y-%m-%d')
+                return s
+
+            rows = [
+                (e[0], e[1], fmt_date(e[2]), fmt_date(e[3]), e[4], e[5],
+                 parse_products(e[6]), e[7], e[8], e[9], e[10], e[11])
+                for e in events
+            ]
+            payload = encode_columnar(rows, EVENT_COLUMNS, EVENT_DICT_COLUMNS)
+            response = json_response(payload, 200, mimetype=COLUMNAR_MIMETYPE)
+            response.vary.add("Accept")
+            return response
+
         events_data = []
         for e in events:
             events_data.append({
@@ -112,17 +192,19 @@ def get_events():
                 "sale_hour": e.sale_hour,
                 "payment_method": e.payment_method
             })
-        return jsonify(events_data), 200
+        response = json_response(events_data, 200)
+        response.vary.add("Accept")
+        return response
     except Exception as e:
-        return jsonify({"message": f"Error fetching events: {str(e)}"}), 400
+        return json_response({"message": f"Error fetching events: {str(e)}"}), 400
 
 @api_bp.route('/import-events', methods=['POST'])
 def import_events():
     if 'file' not in request.files:
-        return jsonify({"message": "No file part in the request"}), 400
+        return json_response({"message": "No file part in the request"}), 400
     file = request.files['file']
     if file.filename == '':
-        return jsonify({"message": "No file selected"}), 400
+        return json_response({"message": "No file selected"}), 400
 
     try:
         filename = file.filename.lower()
@@ -139,18 +221,18 @@ def import_events():
                     except Exception:
                         products_list = [p.strip() for p in products.split(",")]
                     new_event = EventData(
-                        event_name=row['eventName'],
                         event_date_from=datetime.strptime(row['eventDateFrom'], '%Y-%m-%d'),
                         event_date_to=datetime.strptime(row['eventDateTo'], '%Y-%m-%d'),
-                        venue_name=row['venueName'],
                         operating_hours=row['operatingHours'],
                         products_sold=json.dumps(products_list),
                         sales_volume=float(row['salesVolume']),
                         price_per_unit=float(row['pricePerUnit']),
                         total_revenue=float(row['totalRevenue']),
-                        sale_hour=int(row['saleHour']),
-                        payment_method=row['paymentMethod']
+                        sale_hour=int(row['saleHour'])
                     )
+                    # Resolve dimension ids only once the row has parsed.
+                    new_event.event_id, new_event.venue_id, new_event.payment_method_id = \
+                        resolve_dimension_ids(row['eventName'], row['venueName'], row['paymentMethod'])
                     db.session.add(new_event)
                     events_imported += 1
                 except Exception:
@@ -183,31 +265,31 @@ def import_events():
                         products_list = [p.strip() for p in str(selectedProducts).split(",")]
 
                     new_event = EventData(
-                        event_name=str(eventName),
                         event_date_from=datetime.strptime(str(eventDateFrom), "%Y-%m-%d"),
                         event_date_to=datetime.strptime(str(eventDateTo), "%Y-%m-%d"),
-                        venue_name=str(venueName),
                         operating_hours=str(operatingHours),
                         products_sold=json.dumps(products_list),
                         sales_volume=float(salesVolume),
                         price_per_unit=float(pricePerUnit),
                         total_revenue=float(totalRevenue),
-                        sale_hour=int(saleHour),
-                        payment_method=str(paymentMethod)
+                        sale_hour=int(saleHour)
                     )
+                    # Resolve dimension ids only once the row has parsed.
+                    new_event.event_id, new_event.venue_id, new_event.payment_method_id = \
+                        resolve_dimension_ids(eventName, venueName, paymentMethod)
                     db.session.add(new_event)
                     events_imported += 1
                 except Exception:
                     continue
         else:
-            return jsonify({"message": "Unsupported file type"}), 400
+            return json_response({"message": "Unsupported file type"}), 400
 
         db.session.commit()
-        return jsonify({"message": f"Successfully imported {events_imported} events."}), 201
+        return json_response({"message": f"Successfully imported {events_imported} events."}), 201
 
     except Exception as e:
         db.session.rollback()
-        return jsonify({"message": f"Error importing events: {str(e)}"}), 400
+        return json_response({"message": f"Error importing events: {str(e)}"}), 400
 
 @api_bp.route('/export-csv', methods=['GET'])
 def export_csv():
@@ -238,7 +320,7 @@ def export_csv():
         response.headers["Content-type"] = "text/csv"
         return response
     except Exception as e:
-        return jsonify({"message": f"Error exporting CSV: {str(e)}"}), 400
+        return json_response({"message": f"Error exporting CSV: {str(e)}"}), 400
 
 @api_bp.route('/export-excel', methods=['GET'])
 def export_excel():
@@ -279,7 +361,7 @@ def export_excel():
             mimetype="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )
     except Exception as e:
-        return jsonify({"message": f"Error exporting Excel: {str(e)}"}), 400
+        return json_response({"message": f"Error exporting Excel: {str(e)}"}), 400
 @api_bp.route('/export-pdf', methods=['GET'])
 def export_pdf():
     """
@@ -315,7 +397,7 @@ def export_pdf():
         # Fetch events
         events = EventData.query.all()
         if not events:
-            return jsonify({"message": "No events found to generate report."}), 400
+            return json_response({"message": "No events found to generate report."}), 400
 
         # Functions for random placeholders if data is missing
         def random_price():
@@ -506,4 +588,4 @@ def export_pdf():
         )
 
     except Exception as e:
-        return jsonify({"message": f"Error exporting PDF: {str(e)}"}), 400
+        return json_response({"message": f"Error exporting PDF: {str(e)}"}), 400
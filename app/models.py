@@ -1,13 +1,42 @@
 from app import db
 from datetime import datetime
+from sqlalchemy import event as sa_event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# Dimension tables: each distinct name is stored once and referenced by id
+# from the sales rows.
+class Venue(db.Model):
+    __tablename__ = 'venue'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False, unique=True)
+
+    def __repr__(self):
+        return f"<Venue {self.name}>"
+
+class Event(db.Model):
+    __tablename__ = 'event'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(200), nullable=False, unique=True)
+
+    def __repr__(self):
+        return f"<Event {self.name}>"
+
+class PaymentMethod(db.Model):
+    __tablename__ = 'payment_method'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), nullable=False, unique=True)
+
+    def __repr__(self):
+        return f"<PaymentMethod {self.name}>"
 
 class EventData(db.Model):
     __tablename__ = 'event_data'
     id = db.Column(db.Integer, primary_key=True)
 
-    # Basic Event Info
-    event_name = db.Column(db.String(200), nullable=False)
-    venue_name = db.Column(db.String(200), nullable=False)
+    # Basic Event Info (names live in the dimension tables)
+    event_id = db.Column(db.Integer, db.ForeignKey('event.id'), nullable=False, index=True)
+    venue_id = db.Column(db.Integer, db.ForeignKey('venue.id'), nullable=False, index=True)
     operating_hours = db.Column(db.String(100), nullable=True)
 
     # Only two date fields for the event range
@@ -22,7 +51,89 @@ class EventData(db.Model):
 
     # Additional Fields with defaults
     sale_hour = db.Column(db.Integer, nullable=False, server_default='0')
-    payment_method = db.Column(db.String(50), nullable=False, server_default="'Cash'")
+    payment_method_id = db.Column(db.Integer, db.ForeignKey('payment_method.id'), nullable=False, index=True)
+
+    event = db.relationship('Event', lazy='joined')
+    venue = db.relationship('Venue', lazy='joined')
+    payment = db.relationship('PaymentMethod', lazy='joined')
+
+    # String accessors kept for the exports and existing readers
+    @property
+    def event_name(self):
+        return self.event.name if self.event else None
+
+    @property
+    def venue_name(self):
+        return self.venue.name if self.venue else None
+
+    @property
+    def payment_method(self):
+        return self.payment.name if self.payment else None
 
     def __repr__(self):
         return f"<EventData {self.event_name} from {self.event_date_from} to {self.event_date_to}>"
+
+class NameLookup:
+    """
+    In-process name <-> id cache for a dimension table.
+    Unknown names are inserted (and flushed) in the current session. Ids
+    resolved inside a transaction are kept in session.info and only shared
+    with other requests once that transaction commits.
+    """
+    def __init__(self, model):
+        self.model = model
+        self._ids = {}
+
+    def _pending(self, session):
+        pending = session.info.setdefault('name_lookup_pending', {})
+        return pending.setdefault(self.model.__tablename__, {})
+
+    def id_for(self, name):
+        if name is None or name == "":
+            raise ValueError(f"{self.model.__name__} name is required")
+        name = str(name)
+        dim_id = self._ids.get(name)
+        if dim_id is not None:
+            return dim_id
+
+        dim_id = self._pending(db.session()).get(name)
+        if dim_id is None:
+            row = self.model.query.filter_by(name=name).first()
+            if row is None:
+                try:
+                    with db.session.begin_nested():
+                        row = self.model(name=name)
+                        db.session.add(row)
+                except IntegrityError:
+                    # Another request inserted the same name first.
+                    row = self.model.query.filter_by(name=name).one()
+            dim_id = row.id
+            # Re-read: a savepoint rollback discards the session's pending ids.
+            self._pending(db.session())[name] = dim_id
+        return dim_id
+
+    def promote(self, session):
+        """Share the ids resolved in a committed session."""
+        pending = session.info.get('name_lookup_pending', {})
+        self._ids.update(pending.get(self.model.__tablename__, {}))
+
+venue_lookup = NameLookup(Venue)
+event_lookup = NameLookup(Event)
+payment_method_lookup = NameLookup(PaymentMethod)
+
+@sa_event.listens_for(Session, 'after_commit')
+def _promote_lookups(session):
+    for lookup in (venue_lookup, event_lookup, payment_method_lookup):
+        lookup.promote(session)
+    session.info.pop('name_lookup_pending', None)
+
+@sa_event.listens_for(Session, 'after_soft_rollback')
+def _discard_lookups(session, previous_transaction):
+    # Ids flushed in a rolled-back transaction no longer exist.
+    session.info.pop('name_lookup_pending', None)
+
+@sa_event.listens_for(Session, 'after_transaction_end')
+def _end_lookups(session, transaction):
+    # Closing a session without committing also discards its ids.
+    if transaction.parent is None:
+        session.info.pop('name_lookup_pending', None)
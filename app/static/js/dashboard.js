@@ -1,4 +1,198 @@
-const { useState, useEffect, useRef } = React;
+const { useState, useEffect, useRef, useMemo } = React;
+
+// Decode the columnar /api/get-events payload back into row objects.
+// Dictionary-encoded columns arrive as { dict: [...], codes: [...] }.
+const decodeColumnar = (payload) => {
+  if (Array.isArray(payload)) return payload;
+  const { length, columns } = payload;
+  const names = Object.keys(columns);
+  const getters = names.map((name) => {
+    const col = columns[name];
+    if (col && !Array.isArray(col) && col.dict) {
+      const { dict, codes } = col;
+      return (i) => dict[codes[i]];
+    }
+    return (i) => col[i];
+  });
+  const rows = new Array(length);
+  for (let i = 0; i < length; i++) {
+    const row = {};
+    for (let c = 0; c < names.length; c++) {
+      row[names[c]] = getters[c](i);
+    }
+    rows[i] = row;
+  }
+  return rows;
+};
+
+// products_sold is a native array in the columnar format, a JSON string otherwise.
+const parseProducts = (products) => {
+  if (Array.isArray(products)) return products;
+  try {
+    const parsed = JSON.parse(products);
+    return Array.isArray(parsed) ? parsed : null;
+  } catch (err) {
+    return null;
+  }
+};
+
+// Summary/chart aggregates over the events list.
+const createAggregates = () => ({
+  count: 0,
+  firstId: null,
+  lastId: null,
+  totalRevenue: 0,
+  productTotals: {},
+  hourlyTotals: Array(24).fill(0),
+});
+
+// Fold events into prev. Events are returned in id order, so when the
+// rows already counted are still the prefix of the list only the new
+// tail is processed; otherwise everything is recomputed.
+const accumulateAggregates = (prev, events) => {
+  const isAppend =
+    prev.count > 0 &&
+    events.length >= prev.count &&
+    events[0].id === prev.firstId &&
+    events[prev.count - 1].id === prev.lastId;
+  const agg = isAppend
+    ? {
+        ...prev,
+        productTotals: { ...prev.productTotals },
+        hourlyTotals: prev.hourlyTotals.slice(),
+      }
+    : createAggregates();
+
+  for (let i = isAppend ? prev.count : 0; i < events.length; i++) {
+    const evt = events[i];
+    agg.totalRevenue += parseFloat(evt.total_revenue) || 0;
+    const products = parseProducts(evt.products_sold);
+    if (products) {
+      products.forEach((product) => {
+        agg.productTotals[product] = (agg.productTotals[product] || 0) + 1;
+      });
+    }
+    const hour = parseInt(evt.sale_hour, 10);
+    if (hour >= 0 && hour < 24) {
+      agg.hourlyTotals[hour] += parseFloat(evt.sales_volume) || 0;
+    }
+  }
+  agg.count = events.length;
+  agg.firstId = events.length ? events[0].id : null;
+  agg.lastId = events.length ? events[events.length - 1].id : null;
+  return agg;
+};
+
+// Virtualized events table: only the rows inside the scroll viewport
+// (plus some overscan) are rendered; spacer rows keep the scrollbar size.
+const ROW_HEIGHT = 41; // must match .virtual-table tbody tr in dashboard.css
+const VIEWPORT_HEIGHT = 600;
+const OVERSCAN = 10;
+
+// Fixed column widths (px) so the visible window can change without the
+// table re-sizing its columns; see table-layout: fixed in dashboard.css.
+const EVENT_TABLE_COLUMNS = [
+  { label: "Event Name", width: 160 },
+  { label: "Start Date", width: 110 },
+  { label: "End Date", width: 110 },
+  { label: "Venue", width: 160 },
+  { label: "Operating Hours", width: 170 },
+  { label: "Products Sold", width: 220 },
+  { label: "Sales Volume", width: 120 },
+  { label: "Price/Unit", width: 100 },
+  { label: "Total Revenue", width: 130 },
+  { label: "Sale Hour", width: 100 },
+  { label: "Payment Method", width: 150 },
+];
+const EVENT_COLUMN_COUNT = EVENT_TABLE_COLUMNS.length;
+const EVENT_TABLE_WIDTH = EVENT_TABLE_COLUMNS.reduce((acc, col) => acc + col.width, 0);
+
+const EventRow = React.memo(({ evt }) => {
+  const products = parseProducts(evt.products_sold) || evt.products_sold;
+  return (
+    <tr>
+      <td>{evt.event_name}</td>
+      <td>{evt.event_date_from}</td>
+      <td>{evt.event_date_to}</td>
+      <td>{evt.venue_name}</td>
+      <td>{evt.operating_hours}</td>
+      <td>{Array.isArray(products) ? products.join(", ") : products}</td>
+      <td>{evt.sales_volume}</td>
+      <td>{evt.price_per_unit}</td>
+      <td>{evt.total_revenue}</td>
+      <td>{evt.sale_hour}</td>
+      <td>{evt.payment_method}</td>
+    </tr>
+  );
+});
+
+const EventTable = React.memo(({ events }) => {
+  const [scrollTop, setScrollTop] = useState(0);
+  const frameRef = useRef(null);
+
+  // Coalesce scroll events into one state update per animation frame
+  const handleScroll = (e) => {
+    const top = e.currentTarget.scrollTop;
+    if (frameRef.current) cancelAnimationFrame(frameRef.current);
+    frameRef.current = requestAnimationFrame(() => {
+      frameRef.current = null;
+      setScrollTop(top);
+    });
+  };
+
+  useEffect(() => {
+    return () => {
+      if (frameRef.current) cancelAnimationFrame(frameRef.current);
+    };
+  }, []);
+
+  // Keep start even so table-striped row colours don't flip while scrolling
+  let start = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+  start -= start % 2;
+  const end = Math.min(
+    events.length,
+    Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ROW_HEIGHT) + OVERSCAN
+  );
+  const topPadding = start * ROW_HEIGHT;
+  const bottomPadding = (events.length - end) * ROW_HEIGHT;
+
+  return (
+    <div
+      className="virtual-table"
+      style={{ maxHeight: `${VIEWPORT_HEIGHT}px` }}
+      onScroll={handleScroll}
+    >
+      <table
+        className="table table-striped table-bordered table-hover mb-0"
+        style={{ minWidth: `${EVENT_TABLE_WIDTH}px` }}
+      >
+        <colgroup>
+          {EVENT_TABLE_COLUMNS.map((col) => (
+            <col key={col.label} style={{ width: `${col.width}px` }} />
+          ))}
+        </colgroup>
+        <thead>
+          <tr>
+            {EVENT_TABLE_COLUMNS.map((col) => (
+              <th key={col.label}>{col.label}</th>
+            ))}
+          </tr>
+        </thead>
+        <tbody>
+          <tr className="virtual-spacer" style={{ height: `${topPadding}px` }}>
+            <td colSpan={EVENT_COLUMN_COUNT}></td>
+          </tr>
+          {events.slice(start, end).map((evt) => (
+            <EventRow key={evt.id} evt={evt} />
+          ))}
+          <tr className="virtual-spacer" style={{ height: `${bottomPadding}px` }}>
+            <td colSpan={EVENT_COLUMN_COUNT}></td>
+          </tr>
+        </tbody>
+      </table>
+    </div>
+  );
+});
 
 const Dashboard = () => {
   const [showModal, setShowModal] = useState(false);
@@ -27,18 +221,23 @@ const Dashboard = () => {
   ]);
   const [csvFile, setCsvFile] = useState(null);
 
-  // Chart references
+  // Chart references: canvases and the Chart.js instances drawn on them
   const pieChartRef = useRef(null);
-  const [pieChartInstance, setPieChartInstance] = useState(null);
+  const pieChartInstance = useRef(null);
   const barChartRef = useRef(null);
-  const [barChartInstance, setBarChartInstance] = useState(null);
+  const barChartInstance = useRef(null);
+
+  // Running aggregates, folded in incrementally as rows are appended
+  const aggregatesRef = useRef(createAggregates());
 
   // Fetch events from API
   const fetchEvents = async () => {
     try {
-      const response = await fetch("/api/get-events");
+      const response = await fetch("/api/get-events?format=columnar", {
+        headers: { Accept: "application/vnd.sales.columnar+json" },
+      });
       const data = await response.json();
-      setEvents(data);
+      setEvents(decodeColumnar(data));
     } catch (error) {
       console.error("Error fetching events:", error);
     }
@@ -48,43 +247,46 @@ const Dashboard = () => {
     fetchEvents();
   }, []);
 
-  // Update charts when events change
+  // Only rows appended since the last fetch are folded into the aggregates
+  const aggregates = useMemo(() => {
+    aggregatesRef.current = accumulateAggregates(aggregatesRef.current, events);
+    return aggregatesRef.current;
+  }, [events]);
+
+  // Update charts in place when the aggregates change
   useEffect(() => {
     updatePieChart();
     updateBarChart();
-  }, [events]);
+  }, [aggregates]);
 
-  // Calculate summary stats
-  const totalRevenue = events.reduce(
-    (acc, evt) => acc + (parseFloat(evt.total_revenue) || 0),
-    0
-  );
-  const totalTransactions = events.length;
+  // Release the chart instances on unmount
+  useEffect(() => {
+    return () => {
+      if (pieChartInstance.current) pieChartInstance.current.destroy();
+      if (barChartInstance.current) barChartInstance.current.destroy();
+    };
+  }, []);
+
+  // Summary stats
+  const totalRevenue = aggregates.totalRevenue;
+  const totalTransactions = aggregates.count;
   const averageSpend =
     totalTransactions > 0 ? (totalRevenue / totalTransactions).toFixed(2) : 0;
 
   // Update Pie Chart: Sales breakdown by product
   const updatePieChart = () => {
-    const productTotals = {};
-    events.forEach((evt) => {
-      let products = evt.products_sold;
-      try {
-        products = JSON.parse(evt.products_sold);
-      } catch (err) {
-        return;
-      }
-      products.forEach((product) => {
-        productTotals[product] = (productTotals[product] || 0) + 1;
-      });
-    });
-    const labels = Object.keys(productTotals);
-    const data = Object.values(productTotals);
+    const labels = Object.keys(aggregates.productTotals);
+    const data = Object.values(aggregates.productTotals);
 
-    if (pieChartInstance) {
-      pieChartInstance.destroy();
+    if (pieChartInstance.current) {
+      const chart = pieChartInstance.current;
+      chart.data.labels = labels;
+      chart.data.datasets[0].data = data;
+      chart.update();
+      return;
     }
-    const ctx = document.getElementById("salesPieChart").getContext("2d");
-    const newChartInstance = new Chart(ctx, {
+    const ctx = pieChartRef.current.getContext("2d");
+    pieChartInstance.current = new Chart(ctx, {
       type: "pie",
       data: {
         labels: labels,
@@ -112,24 +314,21 @@ const Dashboard = () => {
         },
       },
     });
-    setPieChartInstance(newChartInstance);
   };
 
   // Update Bar Chart: Hourly sales trends using saleHour from event data
   const updateBarChart = () => {
-    const hourlyTotals = Array(24).fill(0);
-    events.forEach((evt) => {
-      const hour = parseInt(evt.sale_hour, 10);
-      hourlyTotals[hour] += parseFloat(evt.sales_volume) || 0;
-    });
-    const labels = Array.from({ length: 24 }, (_, i) => `${i}:00`);
-    const data = hourlyTotals;
+    const data = aggregates.hourlyTotals;
 
-    if (barChartInstance) {
-      barChartInstance.destroy();
+    if (barChartInstance.current) {
+      const chart = barChartInstance.current;
+      chart.data.datasets[0].data = data;
+      chart.update();
+      return;
     }
-    const ctx = document.getElementById("salesBarChart").getContext("2d");
-    const newChartInstance = new Chart(ctx, {
+    const labels = Array.from({ length: 24 }, (_, i) => `${i}:00`);
+    const ctx = barChartRef.current.getContext("2d");
+    barChartInstance.current = new Chart(ctx, {
       type: "bar",
       data: {
         labels: labels,
@@ -153,7 +352,6 @@ const Dashboard = () => {
         },
       },
     });
-    setBarChartInstance(newChartInstance);
   };
 
   const handleAddProduct = () => {
@@ -411,6 +609,7 @@ const Dashboard = () => {
                 <h5 className="card-title text-primary">Sales Distribution</h5>
                 <canvas
                   id="salesPieChart"
+                  ref={pieChartRef}
                   style={{ width: "200px", height: "200px" }}
                 ></canvas>
               </div>
@@ -420,7 +619,7 @@ const Dashboard = () => {
             <div className="card h-100">
               <div className="card-body">
                 <h5 className="card-title text-primary">Sales Over Time</h5>
-                <canvas id="salesBarChart"></canvas>
+                <canvas id="salesBarChart" ref={barChartRef}></canvas>
               </div>
             </div>
           </div>
@@ -454,50 +653,7 @@ const Dashboard = () => {
           <div className="card">
             <div className="card-body">
               <h3 className="mb-3 text-primary">Event Data</h3>
-              <table className="table table-striped table-bordered table-hover">
-                <thead>
-                  <tr>
-                    <th>Event Name</th>
-                    <th>Start Date</th>
-                    <th>End Date</th>
-                    <th>Venue</th>
-                    <th>Operating Hours</th>
-                    <th>Products Sold</th>
-                    <th>Sales Volume</th>
-                    <th>Price/Unit</th>
-                    <th>Total Revenue</th>
-                    <th>Sale Hour</th>
-                    <th>Payment Method</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {events.map((evt) => {
-                    let products = evt.products_sold;
-                    try {
-                      products = JSON.parse(evt.products_sold);
-                    } catch (err) {}
-                    return (
-                      <tr key={evt.id}>
-                        <td>{evt.event_name}</td>
-                        <td>{evt.event_date_from}</td>
-                        <td>{evt.event_date_to}</td>
-                        <td>{evt.venue_name}</td>
-                        <td>{evt.operating_hours}</td>
-                        <td>
-                          {Array.isArray(products)
-                            ? products.join(", ")
-                            : products}
-                        </td>
-                        <td>{evt.sales_volume}</td>
-                        <td>{evt.price_per_unit}</td>
-                        <td>{evt.total_revenue}</td>
-                        <td>{evt.sale_hour}</td>
-                        <td>{evt.payment_method}</td>
-                      </tr>
-                    );
-                  })}
-                </tbody>
-              </table>
+              <EventTable events={events} />
             </div>
           </div>
         </div>
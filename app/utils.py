@@ -0,0 +1,147 @@
+import gzip, json
+from flask import request, Response
+
+# Optional fast JSON encoder; falls back to the standard library.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional brotli compression; gzip is always available.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COLUMNAR_MIMETYPE = "application/vnd.sales.columnar+json"
+
+# Bodies smaller than this are not worth compressing.
+MIN_COMPRESS_SIZE = 500
+
+
+def dumps_json(obj):
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def json_response(obj, status=200, mimetype="application/json"):
+    """Build a JSON response using the fastest available encoder."""
+    return Response(dumps_json(obj), status=status, mimetype=mimetype)
+
+
+def wants_columnar():
+    """
+    Return True if the client negotiated the columnar wire format.
+    Requires ?format=columnar or the columnar type listed explicitly in
+    Accept; wildcards such as */* keep the default row format.
+    """
+    if request.args.get("format") == "columnar":
+        return True
+    listed = any(
+        value == COLUMNAR_MIMETYPE and quality > 0
+        for value, quality in request.accept_mimetypes
+    )
+    if not listed:
+        return False
+    best = request.accept_mimetypes.best_match(["application/json", COLUMNAR_MIMETYPE])
+    return best == COLUMNAR_MIMETYPE
+
+
+def dict_encode(values):
+    """
+    Dictionary-encode a list of repeated values.
+    Returns {"dict": [distinct values], "codes": [index into dict per row]}.
+    """
+    lookup = {}
+    dictionary = []
+    codes = []
+    for value in values:
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(dictionary)
+            dictionary.append(value)
+        codes.append(code)
+    return {"dict": dictionary, "codes": codes}
+
+
+_products_cache = {}
+
+
+def parse_products(raw):
+    """
+    Decode a products_sold JSON string into a list.
+    Identical strings repeat across many rows, so decoded lists are memoized.
+    """
+    if not raw:
+        return []
+    products = _products_cache.get(raw)
+    if products is None:
+        try:
+            products = json.loads(raw)
+        except ValueError:
+            products = [p.strip() for p in raw.split(",") if p.strip()]
+        if not isinstance(products, list):
+            products = [products]
+        if len(_products_cache) < 10000:
+            _products_cache[raw] = products
+    return products
+
+
+def encode_columnar(rows, columns, dict_columns=()):
+    """
+    Transpose row tuples into column arrays.
+    Columns listed in dict_columns are dictionary-encoded.
+    """
+    data = {}
+    for idx, name in enumerate(columns):
+        values = [row[idx] for row in rows]
+        data[name] = dict_encode(values) if name in dict_columns else values
+    return {"format": "columnar", "length": len(rows), "columns": data}
+
+
+def _encoding_quality(name):
+    """Quality the client gives a content coding; an explicit entry beats '*'."""
+    for value, quality in request.accept_encodings:
+        if value.lower() == name:
+            return quality
+    return request.accept_encodings["*"]
+
+
+def compress_response(response):
+    """
+    Compress a response body with brotli or gzip, as accepted by the client.
+    Streamed/file responses and small bodies are left untouched.
+    """
+    if (
+        response.direct_passthrough
+        or response.status_code < 200
+        or response.status_code >= 300
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+
+    # The body may differ by Accept-Encoding whether or not it is compressed.
+    response.vary.add("Accept-Encoding")
+
+    if brotli is not None and _encoding_quality("br") > 0:
+        encoding = "br"
+    elif _encoding_quality("gzip") > 0:
+        encoding = "gzip"
+    else:
+        return response
+
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_SIZE:
+        return response
+
+    if encoding == "br":
+        body = brotli.compress(body, quality=5)
+    else:
+        body = gzip.compress(body, compresslevel=6)
+
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    response.headers["Content-Length"] = str(len(body))
+    return response
@@ -0,0 +1,112 @@
+"""Move event, venue and payment method names into dimension tables
+
+Revision ID: f35f74a256a0
+Revises:
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f35f74a256a0'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (dimension table, name length, old event_data column, new event_data column)
+DIMENSIONS = [
+    ('event', 200, 'event_name', 'event_id'),
+    ('venue', 200, 'venue_name', 'venue_id'),
+    ('payment_method', 50, 'payment_method', 'payment_method_id'),
+]
+
+
+def _columns(table):
+    return {c['name'] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = inspector.get_table_names()
+
+    # create_all() at app startup may already have created the new schema.
+    if 'event_data' not in tables or 'venue_name' not in _columns('event_data'):
+        return
+
+    for table, length, _, _ in DIMENSIONS:
+        if table not in tables:
+            op.create_table(
+                table,
+                sa.Column('id', sa.Integer(), nullable=False),
+                sa.Column('name', sa.String(length=length), nullable=False),
+                sa.PrimaryKeyConstraint('id'),
+                sa.UniqueConstraint('name'),
+            )
+
+    # Deduplicate existing names into the dimension tables.
+    op.execute(
+        "UPDATE event_data SET payment_method = 'Cash' WHERE payment_method IS NULL"
+    )
+    for table, _, old_col, _ in DIMENSIONS:
+        op.execute(
+            f"INSERT INTO {table} (name) "
+            f"SELECT DISTINCT {old_col} FROM event_data "
+            f"WHERE {old_col} IS NOT NULL "
+            f"AND {old_col} NOT IN (SELECT name FROM {table})"
+        )
+
+    with op.batch_alter_table('event_data') as batch_op:
+        for _, _, _, new_col in DIMENSIONS:
+            batch_op.add_column(sa.Column(new_col, sa.Integer(), nullable=True))
+
+    for table, _, old_col, new_col in DIMENSIONS:
+        op.execute(
+            f"UPDATE event_data SET {new_col} = "
+            f"(SELECT id FROM {table} WHERE {table}.name = event_data.{old_col})"
+        )
+
+    with op.batch_alter_table('event_data') as batch_op:
+        for table, _, old_col, new_col in DIMENSIONS:
+            batch_op.alter_column(new_col, existing_type=sa.Integer(), nullable=False)
+            batch_op.create_foreign_key(f'fk_event_data_{new_col}_{table}', table, [new_col], ['id'])
+            batch_op.create_index(f'ix_event_data_{new_col}', [new_col])
+            batch_op.drop_column(old_col)
+
+
+def downgrade():
+    # Foreign keys created by db.create_all() are unnamed in the models, so
+    # look up the names the database actually assigned.
+    fk_names = {}
+    for fk in sa.inspect(op.get_bind()).get_foreign_keys('event_data'):
+        if fk.get('name') and len(fk['constrained_columns']) == 1:
+            fk_names[fk['constrained_columns'][0]] = fk['name']
+
+    with op.batch_alter_table('event_data') as batch_op:
+        batch_op.add_column(sa.Column('event_name', sa.String(length=200), nullable=True))
+        batch_op.add_column(sa.Column('venue_name', sa.String(length=200), nullable=True))
+        batch_op.add_column(sa.Column('payment_method', sa.String(length=50), nullable=True))
+
+    for table, _, old_col, new_col in DIMENSIONS:
+        op.execute(
+            f"UPDATE event_data SET {old_col} = "
+            f"(SELECT name FROM {table} WHERE {table}.id = event_data.{new_col})"
+        )
+
+    with op.batch_alter_table('event_data') as batch_op:
+        batch_op.alter_column('event_name', existing_type=sa.String(length=200), nullable=False)
+        batch_op.alter_column('venue_name', existing_type=sa.String(length=200), nullable=False)
+        batch_op.alter_column(
+            'payment_method', existing_type=sa.String(length=50),
+            nullable=False, server_default="'Cash'"
+        )
+        for table, _, _, new_col in DIMENSIONS:
+            # Unnamed (SQLite) foreign keys are dropped with their column.
+            if new_col in fk_names:
+                batch_op.drop_constraint(fk_names[new_col], type_='foreignkey')
+            batch_op.drop_index(f'ix_event_data_{new_col}')
+            batch_op.drop_column(new_col)
+
+    for table, _, _, _ in DIMENSIONS:
+        op.drop_table(table)